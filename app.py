@@ -4,19 +4,109 @@ Web service for managing publication styles and export coordination
 Version: 20250602_000000_0_0_0_001
 """
 
-from flask import Flask, request, jsonify, render_template
+from flask import Flask, Response, request, jsonify, render_template
+from flask.json.provider import DefaultJSONProvider
 from services.style_manager import StyleManager
 from services.template_processor import TemplateProcessor
 from services.export_coordinator import ExportCoordinator
+from collections.abc import Mapping
+import hashlib
 import logging
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    uvloop = None
+
+
+class JSONProvider(DefaultJSONProvider):
+    """JSON provider that also encodes read-only mappings such as MappingProxyType"""
+    
+    @staticmethod
+    def default(o):
+        if isinstance(o, Mapping):
+            return dict(o)
+        return DefaultJSONProvider.default(o)
+
+
+class OrjsonProvider(JSONProvider):
+    """
+    JSON provider that encodes responses with orjson
+    
+    Payloads orjson cannot encode, such as integers wider than 64 bits, fall
+    back to the stdlib encoder. Request bodies are always parsed with the
+    stdlib decoder, because orjson would silently turn big integers into floats.
+    """
+    
+    def dumps(self, obj, **kwargs):
+        try:
+            return orjson.dumps(obj, default=self.default, option=orjson.OPT_NON_STR_KEYS).decode()
+        except orjson.JSONEncodeError:
+            return super().dumps(obj, **kwargs)
+
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app) if orjson is not None else JSONProvider(app)
 logging.basicConfig(level=logging.INFO)
 
 style_manager = StyleManager()
 template_processor = TemplateProcessor()
 export_coordinator = ExportCoordinator()
 
+def _iter_json(value, depth=3):
+    """Encode value as JSON in chunks, descending `depth` levels into dicts and lists"""
+    if depth and isinstance(value, dict):
+        yield '{'
+        for i, (key, item) in enumerate(value.items()):
+            if i:
+                yield ','
+            yield app.json.dumps(str(key))
+            yield ':'
+            yield from _iter_json(item, depth - 1)
+        yield '}'
+    elif depth and isinstance(value, list):
+        yield '['
+        for i, item in enumerate(value):
+            if i:
+                yield ','
+            yield from _iter_json(item, depth - 1)
+        yield ']'
+    else:
+        yield app.json.dumps(value)
+
+# ETags for rarely changing GET payloads, keyed by endpoint: (version, etag)
+_etag_cache = {}
+
+def _compute_etag(payload):
+    """Compute an ETag from the stable part of a JSON payload"""
+    return hashlib.md5(app.json.dumps(payload).encode('utf-8')).hexdigest()
+
+def _cached_etag_matches(cache_key, version):
+    """Check whether the client already holds the cached representation for this version"""
+    cached = _etag_cache.get(cache_key)
+    return cached is not None and cached[0] == version and request.if_none_match.contains(cached[1])
+
+def _not_modified(cache_key):
+    """Build an empty 304 response carrying the cached ETag"""
+    response = app.response_class(status=304)
+    response.set_etag(_etag_cache[cache_key][1])
+    return response
+
+def _etag_response(cache_key, version, payload, stable_payload, cache_control):
+    """Serialize payload with an ETag derived from stable_payload and cache the ETag"""
+    etag = _compute_etag(stable_payload)
+    _etag_cache[cache_key] = (version, etag)
+    response = jsonify(payload)
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = cache_control
+    return response.make_conditional(request)
+
 @app.route('/')
 def index():
     """Main interface for publication style configuration"""
@@ -26,8 +116,12 @@ def index():
 def get_available_styles():
     """Get list of available publication styles"""
     try:
+        version = style_manager.get_styles_version()
+        if _cached_etag_matches('styles', version):
+            return _not_modified('styles')
+        
         styles = style_manager.get_available_styles()
-        return jsonify(styles)
+        return _etag_response('styles', version, styles, styles['styles'], 'no-cache')
     except Exception as e:
         app.logger.error(f"Error getting styles: {str(e)}")
         return jsonify({'error': 'Failed to retrieve styles'}), 500
@@ -36,6 +130,10 @@ def get_available_styles():
 def get_style_config(style_name):
     """Get configuration for specific publication style"""
     try:
+        payload = style_manager.get_style_config_bytes(style_name)
+        if payload is not None:
+            return Response(payload, mimetype='application/json')
+        
         config = style_manager.get_style_config(style_name)
         if config:
             return jsonify(config)
@@ -51,6 +149,7 @@ def update_style_config(style_name):
     try:
         config_data = request.get_json()
         result = style_manager.update_style_config(style_name, config_data)
+        _etag_cache.pop('styles', None)
         return jsonify(result)
     except Exception as e:
         app.logger.error(f"Error updating style config: {str(e)}")
@@ -76,7 +175,7 @@ def process_template():
         return jsonify({'error': 'Template processing failed'}), 500
 
 @app.route('/api/export/coordinate', methods=['POST'])
-def coordinate_export():
+async def coordinate_export():
     """Coordinate export with other services"""
     try:
         data = request.get_json()
@@ -88,8 +187,8 @@ def coordinate_export():
             'export_options': data.get('export_options', {})
         }
         
-        result = export_coordinator.coordinate_export(export_config)
-        return jsonify(result)
+        result = await export_coordinator.coordinate_export_async(export_config)
+        return Response(_iter_json(result), mimetype='application/json')
     
     except Exception as e:
         app.logger.error(f"Export coordination error: {str(e)}")
@@ -111,9 +210,14 @@ def validate_style():
 def get_template(template_name):
     """Get specific template configuration"""
     try:
+        cache_key = f'template:{template_name}'
+        if _cached_etag_matches(cache_key, None):
+            return _not_modified(cache_key)
+        
         template = template_processor.get_template(template_name)
         if template:
-            return jsonify(template)
+            stable_template = template_processor.get_template_config(template_name)
+            return _etag_response(cache_key, None, template, stable_template, 'public, max-age=3600')
         else:
             return jsonify({'error': 'Template not found'}), 404
     except Exception as e:
@@ -126,4 +230,4 @@ def health_check():
     return jsonify({'status': 'healthy', 'service': 'publication-style-config-server'})
 
 if __name__ == '__main__':
-    app.run(debug=True, host='0.0.0.0', port=5002)
\ No newline at end of file
+    app.run(host='0.0.0.0', port=5002)
\ No newline at end of file
@@ -4,19 +4,59 @@ Coordinates exports with other services in the ecosystem
 """
 
 import requests
-import json
-from typing import Dict, List, Any, Optional
+from requests.adapters import HTTPAdapter
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
 from datetime import datetime
 import asyncio
 import aiohttp
+import secrets
+import sys
+import threading
+import time
+from collections import deque
+from itertools import islice
+from types import MappingProxyType
+
+# Waves of (workflow index, action handler) pairs that can run concurrently
+WorkflowSchedule = Tuple[Tuple[Tuple[int, Callable], ...], ...]
 
 class ExportCoordinator:
     """Service for coordinating exports across multiple services"""
     
+    _REQUIRED_FIELDS = frozenset({'content', 'style', 'format'})
+    
     def __init__(self):
-        self.service_registry = self._initialize_service_registry()
-        self.export_formats = self._initialize_export_formats()
-        self.coordination_history = []
+        self.service_registry = self._freeze_lookup(self._initialize_service_registry())
+        self.export_formats = self._freeze_lookup(self._initialize_export_formats())
+        self._workflow_templates = self._build_workflow_templates()
+        self.coordination_history = deque(maxlen=100)
+        self._success_count = 0
+        self._history_lock = threading.Lock()
+        self.session = self._create_http_session()
+        self._health_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._health_ttl = 3.0
+        self._health_lock = threading.Lock()
+        self._workflow_schedules: Dict[Tuple, Tuple] = {}
+        self._workflow_schedule_limit = 128
+        self._action_handlers = {
+            'preprocess_content': self._do_preprocess_content,
+            'coordinate_assets': self._do_coordinate_assets,
+            'format_conversion': self._do_format_conversion,
+            'validate_output': self._do_validate_output
+        }
+    
+    def _create_http_session(self) -> requests.Session:
+        """Create a pooled HTTP session so health probes reuse keep-alive connections"""
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=0)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+    
+    @staticmethod
+    def _freeze_lookup(table: Dict[str, Dict[str, Any]]) -> Mapping[str, Dict[str, Any]]:
+        """Wrap a static lookup table read-only, with interned keys for identity compares"""
+        return MappingProxyType({sys.intern(key): value for key, value in table.items()})
     
     def _initialize_service_registry(self) -> Dict[str, Dict[str, Any]]:
         """Initialize registry of available services"""
@@ -25,19 +65,22 @@ class ExportCoordinator:
                 'url': 'http://localhost:5001',
                 'capabilities': ['distance_calculation', 'visualization', 'data_export'],
                 'export_formats': ['json', 'csv', 'excel'],
-                'health_endpoint': '/health'
+                'health_endpoint': '/health',
+                'health_method': 'HEAD'
             },
             'styles_gallery': {
                 'url': 'http://localhost:4090',
                 'capabilities': ['style_management', 'asset_serving', 'preview_generation'],
                 'export_formats': ['html', 'css', 'json'],
-                'health_endpoint': '/health'
+                'health_endpoint': '/health',
+                'health_method': 'HEAD'
             },
             'style_assets': {
                 'url': 'http://localhost:5003',
                 'capabilities': ['asset_management', 'font_serving', 'color_schemes'],
                 'export_formats': ['zip', 'tar', 'json'],
-                'health_endpoint': '/health'
+                'health_endpoint': '/health',
+                'health_method': 'HEAD'
             }
         }
     
@@ -48,35 +91,35 @@ class ExportCoordinator:
                 'name': 'PDF Document',
                 'mime_type': 'application/pdf',
                 'requires_latex': True,
-                'compatible_styles': ['ieee', 'nature', 'apa'],
+                'compatible_styles': frozenset({'ieee', 'nature', 'apa'}),
                 'processing_service': 'publication_style_config_server'
             },
             'docx': {
                 'name': 'Microsoft Word Document',
                 'mime_type': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
                 'requires_latex': False,
-                'compatible_styles': ['ieee', 'nature', 'apa'],
+                'compatible_styles': frozenset({'ieee', 'nature', 'apa'}),
                 'processing_service': 'publication_style_config_server'
             },
             'html': {
                 'name': 'HTML Document',
                 'mime_type': 'text/html',
                 'requires_latex': False,
-                'compatible_styles': ['ieee', 'nature', 'apa', 'web'],
+                'compatible_styles': frozenset({'ieee', 'nature', 'apa', 'web'}),
                 'processing_service': 'styles_gallery'
             },
             'latex': {
                 'name': 'LaTeX Source',
                 'mime_type': 'text/x-tex',
                 'requires_latex': False,
-                'compatible_styles': ['ieee', 'nature', 'apa'],
+                'compatible_styles': frozenset({'ieee', 'nature', 'apa'}),
                 'processing_service': 'publication_style_config_server'
             },
             'markdown': {
                 'name': 'Markdown Document',
                 'mime_type': 'text/markdown',
                 'requires_latex': False,
-                'compatible_styles': ['github', 'basic'],
+                'compatible_styles': frozenset({'github', 'basic'}),
                 'processing_service': 'publication_style_config_server'
             }
         }
@@ -91,7 +134,12 @@ class ExportCoordinator:
         Returns:
             Dictionary containing coordination results
         """
+        return asyncio.run(self.coordinate_export_async(export_config))
+    
+    async def coordinate_export_async(self, export_config: Dict[str, Any]) -> Dict[str, Any]:
+        """Coordinate export across multiple services from within a running event loop"""
         coordination_id = self._generate_coordination_id()
+        timestamp = self._get_timestamp()
         
         # Validate export configuration
         validation_result = self._validate_export_config(export_config)
@@ -100,20 +148,20 @@ class ExportCoordinator:
                 'success': False,
                 'coordination_id': coordination_id,
                 'errors': validation_result['errors'],
-                'timestamp': self._get_timestamp()
+                'timestamp': timestamp
             }
         
         # Check service availability
-        available_services = self._check_service_availability(export_config['target_services'])
+        available_services = await self._check_service_availability(export_config['target_services'])
         
         # Plan export workflow
         workflow = self._plan_export_workflow(export_config, available_services)
         
         # Execute export workflow
-        execution_result = self._execute_export_workflow(workflow, coordination_id)
+        execution_result = await self._execute_export_workflow(workflow, coordination_id)
         
         # Store coordination history
-        self._store_coordination_history(coordination_id, export_config, execution_result)
+        self._store_coordination_history(coordination_id, export_config, execution_result, timestamp)
         
         return {
             'success': execution_result['success'],
@@ -121,7 +169,7 @@ class ExportCoordinator:
             'workflow': workflow,
             'results': execution_result,
             'available_services': available_services,
-            'timestamp': self._get_timestamp()
+            'timestamp': timestamp
         }
     
     def _validate_export_config(self, config: Dict[str, Any]) -> Dict[str, Any]:
@@ -133,36 +181,47 @@ class ExportCoordinator:
         }
         
         # Required fields
-        required_fields = ['content', 'style', 'format']
-        for field in required_fields:
-            if field not in config:
-                validation_result['errors'].append(f'Missing required field: {field}')
-                validation_result['valid'] = False
+        missing_fields = self._REQUIRED_FIELDS - config.keys()
+        if missing_fields:
+            validation_result['errors'].extend(
+                f'Missing required field: {field}' for field in sorted(missing_fields)
+            )
+            validation_result['valid'] = False
+        
+        # Lookups below hash the values, so anything but a string counts as unknown
+        export_format = config.get('format')
+        if isinstance(export_format, str):
+            export_format = sys.intern(export_format)
+        else:
+            export_format = None
         
         # Format validation
-        if 'format' in config and config['format'] not in self.export_formats:
+        if 'format' in config and export_format not in self.export_formats:
             validation_result['errors'].append(f'Unsupported export format: {config["format"]}')
             validation_result['valid'] = False
         
         # Style compatibility
         if 'style' in config and 'format' in config:
-            format_config = self.export_formats.get(config['format'], {})
-            compatible_styles = format_config.get('compatible_styles', [])
-            if compatible_styles and config['style'] not in compatible_styles:
+            format_config = self.export_formats.get(export_format, {})
+            compatible_styles = format_config.get('compatible_styles', frozenset())
+            style = config['style']
+            if compatible_styles and (not isinstance(style, str) or style not in compatible_styles):
                 validation_result['warnings'].append(
                     f'Style {config["style"]} may not be compatible with format {config["format"]}'
                 )
         
         return validation_result
     
-    def _check_service_availability(self, target_services: List[str]) -> Dict[str, Dict[str, Any]]:
+    async def _check_service_availability(self, target_services: List[str]) -> Dict[str, Dict[str, Any]]:
         """Check availability of target services"""
         availability = {}
+        registered_services = [name for name in target_services if name in self.service_registry]
+        health_results = await self._check_services_health_async(registered_services)
         
         for service_name in target_services:
             if service_name in self.service_registry:
                 service_config = self.service_registry[service_name]
-                health_status = self._check_service_health(service_config)
+                health_status = health_results[service_name]
                 availability[service_name] = {
                     'available': health_status['healthy'],
                     'response_time': health_status.get('response_time', 0),
@@ -177,18 +236,111 @@ class ExportCoordinator:
         
         return availability
     
+    def _check_services_health(self, service_names: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Check health of several services, reusing results probed within the TTL"""
+        results, stale_services = self._get_cached_health(service_names)
+        if stale_services:
+            results.update(self._cache_health(self._probe_services_health(stale_services)))
+        return results
+    
+    async def _check_services_health_async(self, service_names: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Check health of several services from within a running event loop"""
+        results, stale_services = self._get_cached_health(service_names)
+        if stale_services:
+            results.update(self._cache_health(await self._gather_service_health(stale_services)))
+        return results
+    
+    def _get_cached_health(self, service_names: List[str]) -> Tuple[Dict[str, Dict[str, Any]], List[str]]:
+        """Split services into fresh cached results and services that need probing"""
+        results = {}
+        stale_services = []
+        now = time.monotonic()
+        
+        for name in service_names:
+            cached = self._health_cache.get(name)
+            if cached is not None and now - cached[0] < self._health_ttl:
+                results[name] = cached[1]
+            else:
+                stale_services.append(name)
+        
+        return results, stale_services
+    
+    def _cache_health(self, probed: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """Record freshly probed health results"""
+        probed_at = time.monotonic()
+        with self._health_lock:
+            for name, health_status in probed.items():
+                self._health_cache[name] = (probed_at, health_status)
+        return probed
+    
+    def _probe_services_health(self, service_names: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Probe several services concurrently"""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self._gather_service_health(service_names))
+        
+        # Already inside an event loop; fall back to the pooled synchronous session
+        return {
+            name: self._check_service_health(self.service_registry[name])
+            for name in service_names
+        }
+    
+    def refresh_health(self):
+        """Discard cached health results so the next check probes every service"""
+        with self._health_lock:
+            self._health_cache.clear()
+    
+    async def _gather_service_health(self, service_names: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Probe all services over one shared session and collect the results"""
+        connector = aiohttp.TCPConnector(limit=32)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            results = await asyncio.gather(*[
+                self._check_service_health_async(session, name, self.service_registry[name])
+                for name in service_names
+            ])
+        return dict(results)
+    
+    async def _check_service_health_async(self, session: aiohttp.ClientSession, service_name: str,
+                                          service_config: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
+        """Check health of individual service without blocking the event loop"""
+        try:
+            start_time = time.perf_counter()
+            
+            async with session.request(
+                service_config.get('health_method', 'HEAD'),
+                f"{service_config['url']}{service_config['health_endpoint']}",
+                timeout=aiohttp.ClientTimeout(total=3.0, sock_connect=1.0, sock_read=2.0),
+                allow_redirects=False
+            ) as response:
+                response_time = time.perf_counter() - start_time
+                
+                return service_name, {
+                    'healthy': response.status == 200,
+                    'response_time': response_time,
+                    'status_code': response.status
+                }
+        
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            return service_name, {
+                'healthy': False,
+                'response_time': None,
+                'error': 'Connection failed'
+            }
+    
     def _check_service_health(self, service_config: Dict[str, Any]) -> Dict[str, Any]:
         """Check health of individual service"""
         try:
-            import time
-            start_time = time.time()
+            start_time = time.perf_counter()
             
-            response = requests.get(
+            response = self.session.request(
+                service_config.get('health_method', 'HEAD'),
                 f"{service_config['url']}{service_config['health_endpoint']}",
-                timeout=5
+                timeout=(1.0, 2.0),
+                allow_redirects=False
             )
             
-            response_time = time.time() - start_time
+            response_time = time.perf_counter() - start_time
             
             return {
                 'healthy': response.status_code == 200,
@@ -203,19 +355,54 @@ class ExportCoordinator:
                 'error': 'Connection failed'
             }
     
+    def _build_workflow_templates(self) -> Dict[str, Tuple[Dict[str, Any], ...]]:
+        """Build the static portion of each format's workflow steps"""
+        workflow_templates = {}
+        
+        for export_format, format_config in self.export_formats.items():
+            processing_service = format_config.get('processing_service', 'publication_style_config_server')
+            workflow_templates[export_format] = (
+                {
+                    'step': 1,
+                    'action': 'preprocess_content',
+                    'service': 'publication_style_config_server',
+                    'description': 'Process content with style and template'
+                },
+                {
+                    'step': 2,
+                    'action': 'coordinate_assets',
+                    'service': 'style_assets',
+                    'description': 'Gather required style assets'
+                },
+                {
+                    'step': 3,
+                    'action': 'format_conversion',
+                    'service': processing_service,
+                    'description': f'Convert to {export_format} format'
+                },
+                {
+                    'step': 4,
+                    'action': 'validate_output',
+                    'service': 'publication_style_config_server',
+                    'description': 'Validate export quality and completeness'
+                }
+            )
+        
+        return workflow_templates
+    
     def _plan_export_workflow(self, export_config: Dict[str, Any], 
                              available_services: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Plan export workflow based on configuration and available services"""
         workflow = []
         export_format = export_config['format']
-        format_config = self.export_formats[export_format]
+        preprocess_step, assets_step, conversion_step, validation_step = self._workflow_templates[export_format]
+        style_assets = available_services.get('style_assets')
+        has_assets = style_assets is not None and style_assets['available']
         
         # Step 1: Content preprocessing
         workflow.append({
-            'step': 1,
-            'action': 'preprocess_content',
-            'service': 'publication_style_config_server',
-            'description': 'Process content with style and template',
+            **preprocess_step,
+            'depends_on': [],
             'inputs': {
                 'content': export_config['content'],
                 'style': export_config['style'],
@@ -224,12 +411,10 @@ class ExportCoordinator:
         })
         
         # Step 2: Asset coordination (if style assets needed)
-        if 'style_assets' in available_services and available_services['style_assets']['available']:
+        if has_assets:
             workflow.append({
-                'step': 2,
-                'action': 'coordinate_assets',
-                'service': 'style_assets',
-                'description': 'Gather required style assets',
+                **assets_step,
+                'depends_on': [],
                 'inputs': {
                     'style': export_config['style'],
                     'format': export_format
@@ -237,15 +422,12 @@ class ExportCoordinator:
             })
         
         # Step 3: Format-specific processing
-        processing_service = format_config.get('processing_service', 'publication_style_config_server')
         workflow.append({
-            'step': 3,
-            'action': 'format_conversion',
-            'service': processing_service,
-            'description': f'Convert to {export_format} format',
+            **conversion_step,
+            'depends_on': [1, 2] if has_assets else [1],
             'inputs': {
                 'processed_content': 'from_step_1',
-                'assets': 'from_step_2' if len(workflow) > 1 else None,
+                'assets': 'from_step_2' if has_assets else None,
                 'format': export_format,
                 'export_options': export_config.get('export_options', {})
             }
@@ -253,10 +435,8 @@ class ExportCoordinator:
         
         # Step 4: Quality validation
         workflow.append({
-            'step': 4,
-            'action': 'validate_output',
-            'service': 'publication_style_config_server',
-            'description': 'Validate export quality and completeness',
+            **validation_step,
+            'depends_on': [3],
             'inputs': {
                 'exported_content': 'from_step_3',
                 'validation_rules': export_config.get('validation_rules', {})
@@ -265,9 +445,15 @@ class ExportCoordinator:
         
         return workflow
     
-    def _execute_export_workflow(self, workflow: List[Dict[str, Any]], 
-                                coordination_id: str) -> Dict[str, Any]:
-        """Execute export workflow"""
+    async def _execute_export_workflow(self, workflow: List[Dict[str, Any]], 
+                                      coordination_id: str) -> Dict[str, Any]:
+        """
+        Execute export workflow in dependency-ordered waves
+        
+        Steps in a wave are gathered together, but the current handlers are
+        synchronous mocks, so they still run one after another; the wave
+        schedule only becomes real overlap once handlers await service calls.
+        """
         execution_result = {
             'success': True,
             'steps_completed': 0,
@@ -276,11 +462,23 @@ class ExportCoordinator:
             'final_output': None
         }
         
-        step_outputs = {}
+        waves, unresolved_steps = self._get_workflow_schedule(workflow)
+        final_step = workflow[-1]['step'] if workflow else None
         
-        for step in workflow:
-            try:
-                step_result = self._execute_workflow_step(step, step_outputs, coordination_id)
+        for wave in waves:
+            step_results = await asyncio.gather(*[
+                self._run_workflow_step(handler, workflow[index], coordination_id)
+                for index, handler in wave
+            ], return_exceptions=True)
+            
+            for (index, _), step_result in zip(wave, step_results):
+                step = workflow[index]
+                if isinstance(step_result, Exception):
+                    execution_result['success'] = False
+                    execution_result['errors'].append(
+                        f"Step {step['step']} execution failed: {str(step_result)}"
+                    )
+                    continue
                 
                 execution_result['step_results'].append({
                     'step': step['step'],
@@ -294,115 +492,166 @@ class ExportCoordinator:
                 
                 if step_result['success']:
                     execution_result['steps_completed'] += 1
-                    step_outputs[f"step_{step['step']}"] = step_result['output']
                     
                     # Store final output if this is the last step
-                    if step['step'] == len(workflow):
+                    if step['step'] == final_step:
                         execution_result['final_output'] = step_result['output']
                 else:
                     execution_result['success'] = False
                     execution_result['errors'].append(
                         f"Step {step['step']} failed: {step_result.get('error', 'Unknown error')}"
                     )
-                    break
             
-            except Exception as e:
-                execution_result['success'] = False
-                execution_result['errors'].append(f"Step {step['step']} execution failed: {str(e)}")
+            if not execution_result['success']:
                 break
         
+        if unresolved_steps and execution_result['success']:
+            execution_result['success'] = False
+            execution_result['errors'].append(f"Unresolved dependencies for steps: {unresolved_steps}")
+        
         return execution_result
     
-    def _execute_workflow_step(self, step: Dict[str, Any], 
-                              step_outputs: Dict[str, Any], 
-                              coordination_id: str) -> Dict[str, Any]:
-        """Execute individual workflow step"""
-        import time
-        start_time = time.time()
-        
-        # Mock implementation - in real scenario, this would make actual service calls
-        # For now, return success with mock data
-        
-        if step['action'] == 'preprocess_content':
-            return {
-                'success': True,
-                'output': {
-                    'processed_content': f"Processed content with style {step['inputs']['style']}",
-                    'sections': ['title', 'abstract', 'introduction', 'conclusion'],
-                    'word_count': 2500,
-                    'style_applied': step['inputs']['style']
-                },
-                'execution_time': time.time() - start_time
-            }
-        
-        elif step['action'] == 'coordinate_assets':
-            return {
-                'success': True,
-                'output': {
-                    'fonts': ['times-new-roman', 'arial'],
-                    'color_scheme': 'academic_blue',
-                    'templates': ['ieee_template.css'],
-                    'asset_count': 15
-                },
-                'execution_time': time.time() - start_time
-            }
-        
-        elif step['action'] == 'format_conversion':
-            return {
-                'success': True,
-                'output': {
-                    'format': step['inputs']['format'],
-                    'file_size': '1.2MB',
-                    'pages': 8,
-                    'conversion_quality': 'high',
-                    'download_url': f'/exports/{coordination_id}/output.{step["inputs"]["format"]}'
-                },
-                'execution_time': time.time() - start_time
-            }
-        
-        elif step['action'] == 'validate_output':
-            return {
-                'success': True,
-                'output': {
-                    'validation_passed': True,
-                    'quality_score': 0.95,
-                    'issues_found': 0,
-                    'recommendations': []
-                },
-                'execution_time': time.time() - start_time
-            }
-        
-        else:
-            return {
-                'success': False,
-                'error': f"Unknown action: {step['action']}",
-                'execution_time': time.time() - start_time
-            }
+    def _get_workflow_schedule(self, workflow: List[Dict[str, Any]]) -> Tuple[WorkflowSchedule, List[int]]:
+        """Get the cached execution schedule for a workflow's shape, building it on first use"""
+        shape = tuple(
+            (step['step'], step['action'], tuple(step.get('depends_on', ())))
+            for step in workflow
+        )
+        schedule = self._workflow_schedules.get(shape)
+        if schedule is None:
+            schedule = self._build_workflow_schedule(workflow)
+            if len(self._workflow_schedules) >= self._workflow_schedule_limit:
+                self._workflow_schedules.pop(next(iter(self._workflow_schedules)), None)
+            self._workflow_schedules[shape] = schedule
+        return schedule
+    
+    def _build_workflow_schedule(self, workflow: List[Dict[str, Any]]) -> Tuple[WorkflowSchedule, List[int]]:
+        """Group workflow steps into waves of concurrently runnable steps with resolved handlers"""
+        waves = []
+        completed = set()
+        pending = list(range(len(workflow)))
+        
+        while pending:
+            ready = [
+                index for index in pending
+                if all(dependency in completed for dependency in workflow[index].get('depends_on', []))
+            ]
+            if not ready:
+                break
+            waves.append(tuple(
+                (index, self._action_handlers.get(workflow[index]['action'], self._do_unknown_action))
+                for index in ready
+            ))
+            completed.update(workflow[index]['step'] for index in ready)
+            pending = [index for index in pending if index not in ready]
+        
+        return tuple(waves), [workflow[index]['step'] for index in pending]
+    
+    async def _run_workflow_step(self, handler: Callable, step: Dict[str, Any],
+                                 coordination_id: str) -> Dict[str, Any]:
+        """Execute individual workflow step as a schedulable task"""
+        # Mock implementation - in real scenario, this would await actual service calls.
+        # The handlers never block or await, so steps gathered in one wave do not overlap
+        return handler(step, coordination_id, time.perf_counter())
+    
+    def _do_preprocess_content(self, step: Dict[str, Any], coordination_id: str,
+                               start_time: float) -> Dict[str, Any]:
+        """Preprocess content with the requested style"""
+        return {
+            'success': True,
+            'output': {
+                'processed_content': f"Processed content with style {step['inputs']['style']}",
+                'sections': ['title', 'abstract', 'introduction', 'conclusion'],
+                'word_count': 2500,
+                'style_applied': step['inputs']['style']
+            },
+            'execution_time': time.perf_counter() - start_time
+        }
+    
+    def _do_coordinate_assets(self, step: Dict[str, Any], coordination_id: str,
+                              start_time: float) -> Dict[str, Any]:
+        """Gather style assets"""
+        return {
+            'success': True,
+            'output': {
+                'fonts': ['times-new-roman', 'arial'],
+                'color_scheme': 'academic_blue',
+                'templates': ['ieee_template.css'],
+                'asset_count': 15
+            },
+            'execution_time': time.perf_counter() - start_time
+        }
+    
+    def _do_format_conversion(self, step: Dict[str, Any], coordination_id: str,
+                              start_time: float) -> Dict[str, Any]:
+        """Convert processed content to the export format"""
+        return {
+            'success': True,
+            'output': {
+                'format': step['inputs']['format'],
+                'file_size': '1.2MB',
+                'pages': 8,
+                'conversion_quality': 'high',
+                'download_url': f'/exports/{coordination_id}/output.{step["inputs"]["format"]}'
+            },
+            'execution_time': time.perf_counter() - start_time
+        }
+    
+    def _do_validate_output(self, step: Dict[str, Any], coordination_id: str,
+                            start_time: float) -> Dict[str, Any]:
+        """Validate exported output"""
+        return {
+            'success': True,
+            'output': {
+                'validation_passed': True,
+                'quality_score': 0.95,
+                'issues_found': 0,
+                'recommendations': []
+            },
+            'execution_time': time.perf_counter() - start_time
+        }
+    
+    def _do_unknown_action(self, step: Dict[str, Any], coordination_id: str,
+                           start_time: float) -> Dict[str, Any]:
+        """Report an action with no registered handler"""
+        return {
+            'success': False,
+            'error': f"Unknown action: {step['action']}",
+            'execution_time': time.perf_counter() - start_time
+        }
     
     def _store_coordination_history(self, coordination_id: str, 
                                    export_config: Dict[str, Any], 
-                                   execution_result: Dict[str, Any]):
+                                   execution_result: Dict[str, Any],
+                                   timestamp: Optional[str] = None):
         """Store coordination history for tracking and debugging"""
         history_entry = {
             'coordination_id': coordination_id,
-            'timestamp': self._get_timestamp(),
+            'timestamp': timestamp or self._get_timestamp(),
             'export_config': export_config,
             'execution_result': execution_result,
             'success': execution_result['success']
         }
         
-        self.coordination_history.append(history_entry)
-        
-        # Keep only last 100 entries
-        if len(self.coordination_history) > 100:
-            self.coordination_history = self.coordination_history[-100:]
+        # The deque's maxlen keeps only the last 100 entries; drop the evicted entry from the count
+        with self._history_lock:
+            if len(self.coordination_history) == self.coordination_history.maxlen:
+                self._success_count -= self.coordination_history[0]['success']
+            self._success_count += history_entry['success']
+            self.coordination_history.append(history_entry)
     
     def get_coordination_history(self, limit: int = 10) -> Dict[str, Any]:
         """Get coordination history"""
+        with self._history_lock:
+            history = list(islice(self.coordination_history,
+                                  max(0, len(self.coordination_history) - limit), None))
+            total_coordinations = len(self.coordination_history)
+            success_rate = self._calculate_success_rate()
+        
         return {
-            'history': self.coordination_history[-limit:],
-            'total_coordinations': len(self.coordination_history),
-            'success_rate': self._calculate_success_rate(),
+            'history': history,
+            'total_coordinations': total_coordinations,
+            'success_rate': success_rate,
             'timestamp': self._get_timestamp()
         }
     
@@ -411,15 +660,15 @@ class ExportCoordinator:
         if not self.coordination_history:
             return 0.0
         
-        successful = sum(1 for entry in self.coordination_history if entry['success'])
-        return successful / len(self.coordination_history)
+        return self._success_count / len(self.coordination_history)
     
     def get_service_status(self) -> Dict[str, Any]:
         """Get status of all registered services"""
         service_status = {}
+        health_results = self._check_services_health(list(self.service_registry))
         
         for service_name, service_config in self.service_registry.items():
-            health_status = self._check_service_health(service_config)
+            health_status = health_results[service_name]
             service_status[service_name] = {
                 'url': service_config['url'],
                 'healthy': health_status['healthy'],
@@ -436,9 +685,8 @@ class ExportCoordinator:
     
     def _generate_coordination_id(self) -> str:
         """Generate unique coordination ID"""
-        import uuid
-        return str(uuid.uuid4())
+        return secrets.token_hex(16)
     
     def _get_timestamp(self) -> str:
         """Get current timestamp"""
-        return datetime.now().isoformat()
\ No newline at end of file
+        return datetime.now().isoformat(timespec='seconds')
\ No newline at end of file
@@ -3,231 +3,168 @@ Style Manager Service
 Manages publication styles and configurations
 """
 
+import functools
 import json
 import os
-from typing import Dict, List, Any, Optional
+import re
+import sys
+import threading
+import time
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
+from types import MappingProxyType
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_REQUIRED_FIELDS = frozenset(('name', 'font_family', 'font_size', 'line_spacing'))
+_REQUIRED_MARGINS = frozenset(('top', 'bottom', 'left', 'right'))
+
+# Style files are machine-written; pretty-print only when asked to
+_PRETTY_JSON = os.environ.get('STYLES_PRETTY') == '1'
+
+# Placeholder replaced with the current timestamp in pre-serialized responses
+_TIMESTAMP_PLACEHOLDER = '__TS__'
+_TIMESTAMP_SENTINEL = f'"{_TIMESTAMP_PLACEHOLDER}"'.encode('ascii')
+
+# A digit run long enough to possibly exceed orjson's 64-bit integer range;
+# 19 digits already covers negatives below the i64 minimum
+_LONG_DIGIT_RUN = re.compile(rb'\d{19}')
+
+# (epoch second, ISO string) of the most recently formatted timestamp
+_timestamp_cache = (0, '')
+
+
+def _encode_json(obj: Any) -> bytes:
+    """Encode obj as compact JSON, or indented when STYLES_PRETTY is set"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if _PRETTY_JSON else 0)
+        except orjson.JSONEncodeError:
+            # e.g. integers wider than 64 bits; the stdlib encoder handles them
+            pass
+    if _PRETTY_JSON:
+        return json.dumps(obj, indent=2).encode('utf-8')
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+def _dump_json(path: str, obj: Any, exclusive: bool = False):
+    """Write obj to path as JSON; with exclusive, fail if path already exists"""
+    with open(path, 'xb' if exclusive else 'wb') as f:
+        f.write(_encode_json(obj))
+
+
+def _replace_json(path: str, obj: Any):
+    """Atomically replace path with obj as JSON so readers never see a partial file"""
+    tmp_path = f'{path}.tmp.{os.getpid()}.{threading.get_ident()}'
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(_encode_json(obj))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_line_spacing(value: Any) -> Optional[float]:
+    """Parse a line spacing value, or None if it is not a number"""
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def _canonicalize(obj: Any, pool: Dict[tuple, Dict[str, Any]]) -> Any:
+    """Intern strings and collapse equal nested dicts into one shared object"""
+    if isinstance(obj, str):
+        return sys.intern(obj)
+    if isinstance(obj, dict):
+        items = tuple(
+            (sys.intern(key), _canonicalize(value, pool)) for key, value in obj.items()
+        )
+        # Canonical nested dicts are unique per content, so identity stands in for them
+        pool_key = tuple(
+            (key, type(value), id(value) if isinstance(value, (dict, list)) else value)
+            for key, value in items
+        )
+        canonical = pool.get(pool_key)
+        if canonical is None:
+            canonical = pool[pool_key] = dict(items)
+        return canonical
+    if isinstance(obj, list):
+        return [_canonicalize(item, pool) for item in obj]
+    return obj
+
+
+def _load_json(path: str) -> Any:
+    """Read JSON from path"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    # orjson reads integers outside the 64-bit range as floats, so files
+    # holding any 19+ digit run go through the stdlib decoder instead
+    if orjson is not None and _LONG_DIGIT_RUN.search(data) is None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Default styles ship as a bundled resource, parsed and canonicalized once per process
+_DEFAULT_STYLES = _canonicalize(
+    _load_json(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'default_styles.json')),
+    {}
+)
+
 
 class StyleManager:
     """Service for managing publication styles"""
     
     def __init__(self):
         self.styles_directory = 'styles/journal_templates'
+        self._path_for: Dict[str, str] = {}
         self.default_styles = self._initialize_default_styles()
+        self._default_templates = {
+            style_name: MappingProxyType(config)
+            for style_name, config in self.default_styles.items()
+        }
+        self._default_bytes = {
+            style_name: self._encode_default_style(style_name, config)
+            for style_name, config in self.default_styles.items()
+        }
+        self._default_summaries = {
+            style_name: {
+                'name': config['name'],
+                'description': config['description'],
+                'source': 'default'
+            }
+            for style_name, config in self.default_styles.items()
+        }
         self._ensure_styles_directory()
         self._create_default_style_files()
+        self._listing_cache = None
+        self._listing_mtime = -1
+        self._listing_lock = threading.Lock()
+        self._config_cache: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+        self._config_cache_limit = 128
     
     def _initialize_default_styles(self) -> Dict[str, Dict[str, Any]]:
         """Initialize default publication styles"""
-        return {
-            'ieee': {
-                'name': 'IEEE',
-                'description': 'Institute of Electrical and Electronics Engineers style',
-                'font_family': 'Times New Roman',
-                'font_size': '10pt',
-                'line_spacing': '1.0',
-                'column_count': 2,
-                'page_margins': {
-                    'top': '0.75in',
-                    'bottom': '1in',
-                    'left': '0.625in',
-                    'right': '0.625in'
-                },
-                'header_styles': {
-                    'title': {
-                        'font_size': '14pt',
-                        'font_weight': 'bold',
-                        'alignment': 'center',
-                        'spacing_after': '12pt'
-                    },
-                    'author': {
-                        'font_size': '12pt',
-                        'font_weight': 'normal',
-                        'alignment': 'center',
-                        'spacing_after': '6pt'
-                    },
-                    'abstract': {
-                        'font_size': '9pt',
-                        'font_weight': 'bold',
-                        'alignment': 'justify',
-                        'indent': '0.25in'
-                    }
-                },
-                'section_styles': {
-                    'heading1': {
-                        'font_size': '10pt',
-                        'font_weight': 'bold',
-                        'alignment': 'left',
-                        'numbering': 'roman_upper',
-                        'spacing_before': '12pt',
-                        'spacing_after': '6pt'
-                    },
-                    'heading2': {
-                        'font_size': '10pt',
-                        'font_weight': 'bold',
-                        'alignment': 'left',
-                        'numbering': 'alpha_upper',
-                        'spacing_before': '6pt',
-                        'spacing_after': '3pt'
-                    }
-                },
-                'reference_style': {
-                    'format': 'ieee_numeric',
-                    'font_size': '9pt',
-                    'hanging_indent': '0.25in'
-                },
-                'figure_caption': {
-                    'prefix': 'Fig.',
-                    'font_size': '9pt',
-                    'alignment': 'center',
-                    'spacing_before': '6pt'
-                },
-                'table_caption': {
-                    'prefix': 'TABLE',
-                    'font_size': '9pt',
-                    'alignment': 'center',
-                    'spacing_after': '6pt'
-                }
-            },
-            'nature': {
-                'name': 'Nature',
-                'description': 'Nature journal publication style',
-                'font_family': 'Times New Roman',
-                'font_size': '12pt',
-                'line_spacing': '1.5',
-                'column_count': 1,
-                'page_margins': {
-                    'top': '1in',
-                    'bottom': '1in',
-                    'left': '1in',
-                    'right': '1in'
-                },
-                'header_styles': {
-                    'title': {
-                        'font_size': '16pt',
-                        'font_weight': 'bold',
-                        'alignment': 'left',
-                        'spacing_after': '18pt'
-                    },
-                    'author': {
-                        'font_size': '12pt',
-                        'font_weight': 'normal',
-                        'alignment': 'left',
-                        'spacing_after': '12pt'
-                    },
-                    'abstract': {
-                        'font_size': '11pt',
-                        'font_weight': 'normal',
-                        'alignment': 'justify',
-                        'spacing_after': '18pt'
-                    }
-                },
-                'section_styles': {
-                    'heading1': {
-                        'font_size': '14pt',
-                        'font_weight': 'bold',
-                        'alignment': 'left',
-                        'numbering': 'none',
-                        'spacing_before': '18pt',
-                        'spacing_after': '12pt'
-                    },
-                    'heading2': {
-                        'font_size': '12pt',
-                        'font_weight': 'bold',
-                        'alignment': 'left',
-                        'numbering': 'none',
-                        'spacing_before': '12pt',
-                        'spacing_after': '6pt'
-                    }
-                },
-                'reference_style': {
-                    'format': 'nature_numeric',
-                    'font_size': '10pt',
-                    'hanging_indent': '0.5in'
-                },
-                'figure_caption': {
-                    'prefix': 'Figure',
-                    'font_size': '10pt',
-                    'alignment': 'left',
-                    'spacing_before': '6pt'
-                },
-                'table_caption': {
-                    'prefix': 'Table',
-                    'font_size': '10pt',
-                    'alignment': 'left',
-                    'spacing_after': '6pt'
-                }
-            },
-            'apa': {
-                'name': 'APA',
-                'description': 'American Psychological Association style',
-                'font_family': 'Times New Roman',
-                'font_size': '12pt',
-                'line_spacing': '2.0',
-                'column_count': 1,
-                'page_margins': {
-                    'top': '1in',
-                    'bottom': '1in',
-                    'left': '1in',
-                    'right': '1in'
-                },
-                'header_styles': {
-                    'title': {
-                        'font_size': '12pt',
-                        'font_weight': 'bold',
-                        'alignment': 'center',
-                        'spacing_after': '12pt'
-                    },
-                    'author': {
-                        'font_size': '12pt',
-                        'font_weight': 'normal',
-                        'alignment': 'center',
-                        'spacing_after': '12pt'
-                    },
-                    'abstract': {
-                        'font_size': '12pt',
-                        'font_weight': 'normal',
-                        'alignment': 'justify',
-                        'spacing_after': '12pt'
-                    }
-                },
-                'section_styles': {
-                    'heading1': {
-                        'font_size': '12pt',
-                        'font_weight': 'bold',
-                        'alignment': 'center',
-                        'numbering': 'none',
-                        'spacing_before': '12pt',
-                        'spacing_after': '12pt'
-                    },
-                    'heading2': {
-                        'font_size': '12pt',
-                        'font_weight': 'bold',
-                        'alignment': 'left',
-                        'numbering': 'none',
-                        'spacing_before': '12pt',
-                        'spacing_after': '6pt'
-                    }
-                },
-                'reference_style': {
-                    'format': 'apa',
-                    'font_size': '12pt',
-                    'hanging_indent': '0.5in'
-                },
-                'figure_caption': {
-                    'prefix': 'Figure',
-                    'font_size': '12pt',
-                    'alignment': 'left',
-                    'spacing_before': '6pt'
-                },
-                'table_caption': {
-                    'prefix': 'Table',
-                    'font_size': '12pt',
-                    'alignment': 'left',
-                    'spacing_after': '6pt'
-                }
-            }
-        }
+        return _DEFAULT_STYLES
+    
+    def _path(self, style_name: str) -> str:
+        """Get the file path for a style, memoizing paths for up to 1024 names"""
+        path = self._path_for.get(style_name)
+        if path is None:
+            path = f'{self.styles_directory}{os.sep}{style_name}.json'
+            if len(self._path_for) < 1024:
+                self._path_for[style_name] = path
+        return path
     
     def _ensure_styles_directory(self):
         """Ensure styles directory exists"""
@@ -235,40 +172,35 @@ class StyleManager:
     
     def _create_default_style_files(self):
         """Create default style configuration files"""
+        with os.scandir(self.styles_directory) as entries:
+            existing_files = {entry.name for entry in entries}
+        
         for style_name, config in self.default_styles.items():
-            file_path = os.path.join(self.styles_directory, f'{style_name}.json')
-            if not os.path.exists(file_path):
-                with open(file_path, 'w') as f:
-                    json.dump(config, f, indent=2)
+            filename = f'{style_name}.json'
+            if filename in existing_files:
+                continue
+            try:
+                _dump_json(self._path(style_name), config, exclusive=True)
+            except FileExistsError:
+                continue
+    
+    def get_styles_version(self) -> Optional[int]:
+        """Get a token that changes whenever the styles directory changes"""
+        try:
+            return os.stat(self.styles_directory).st_mtime_ns
+        except FileNotFoundError:
+            return None
     
     def get_available_styles(self) -> Dict[str, Any]:
         """Get list of available publication styles"""
-        available_styles = {}
-        
-        # Add default styles
-        for style_name, config in self.default_styles.items():
-            available_styles[style_name] = {
-                'name': config['name'],
-                'description': config['description'],
-                'source': 'default'
-            }
+        version = self.get_styles_version()
         
-        # Add custom styles from files
-        if os.path.exists(self.styles_directory):
-            for filename in os.listdir(self.styles_directory):
-                if filename.endswith('.json'):
-                    style_name = filename[:-5]  # Remove .json extension
-                    if style_name not in available_styles:
-                        try:
-                            with open(os.path.join(self.styles_directory, filename), 'r') as f:
-                                config = json.load(f)
-                                available_styles[style_name] = {
-                                    'name': config.get('name', style_name),
-                                    'description': config.get('description', 'Custom style'),
-                                    'source': 'custom'
-                                }
-                        except Exception:
-                            continue
+        # Rescan only when the styles directory has changed
+        with self._listing_lock:
+            if version is None or self._listing_cache is None or version != self._listing_mtime:
+                self._listing_cache = self._scan_available_styles()
+                self._listing_mtime = version
+            available_styles = self._listing_cache
         
         return {
             'styles': available_styles,
@@ -279,34 +211,115 @@ class StyleManager:
             }
         }
     
+    def _scan_available_styles(self) -> Dict[str, Dict[str, Any]]:
+        """Build the style listing from the default styles and the styles directory"""
+        # Add default styles
+        available_styles = dict(self._default_summaries)
+        
+        # Add custom styles from files
+        try:
+            entries = os.scandir(self.styles_directory)
+        except FileNotFoundError:
+            return available_styles
+        
+        with entries:
+            for entry in entries:
+                style_name, _, extension = entry.name.rpartition('.')
+                if extension != 'json' or not style_name or style_name in available_styles:
+                    continue
+                if not entry.is_file():
+                    continue
+                try:
+                    config = _load_json(entry.path)
+                except (OSError, ValueError):
+                    continue
+                # Valid JSON that is not an object is as malformed as bad JSON
+                if not isinstance(config, dict):
+                    continue
+                available_styles[style_name] = {
+                    'name': config.get('name', style_name),
+                    'description': config.get('description', 'Custom style'),
+                    'source': 'custom'
+                }
+        
+        return available_styles
+    
     def get_style_config(self, style_name: str) -> Optional[Dict[str, Any]]:
-        """Get configuration for specific publication style"""
+        """
+        Get configuration for specific publication style
+        
+        Nested sections are shared with the manager's default templates and
+        config cache and must not be mutated by callers.
+        """
         # Check default styles first
-        if style_name in self.default_styles:
-            config = self.default_styles[style_name].copy()
-            config['metadata'] = {
-                'timestamp': self._get_timestamp(),
-                'source': 'default',
-                'style_name': style_name
+        template = self._default_templates.get(style_name)
+        if template is not None:
+            return {
+                **template,
+                'metadata': {
+                    'timestamp': self._get_timestamp(),
+                    'source': 'default',
+                    'style_name': style_name
+                }
             }
-            return config
         
-        # Check custom style files
-        file_path = os.path.join(self.styles_directory, f'{style_name}.json')
-        if os.path.exists(file_path):
-            try:
-                with open(file_path, 'r') as f:
-                    config = json.load(f)
-                    config['metadata'] = {
-                        'timestamp': self._get_timestamp(),
-                        'source': 'custom',
-                        'style_name': style_name
-                    }
-                    return config
-            except Exception:
+        # Check custom style files, reusing the parsed config while the file is unchanged
+        file_path = self._path(style_name)
+        try:
+            stat_result = os.stat(file_path)
+        except OSError:
+            return None
+        
+        file_version = (stat_result.st_mtime_ns, stat_result.st_ino)
+        cached = self._config_cache.get(style_name)
+        if cached is not None and cached[0] == file_version:
+            config = cached[1]
+        else:
+            config = self._load_custom(style_name)
+            if config is None:
                 return None
+            if len(self._config_cache) >= self._config_cache_limit:
+                self._config_cache.pop(next(iter(self._config_cache)), None)
+            self._config_cache[style_name] = (file_version, config)
         
-        return None
+        return {
+            **config,
+            'metadata': {
+                'timestamp': self._get_timestamp(),
+                'source': 'custom',
+                'style_name': style_name
+            }
+        }
+    
+    def get_style_config_bytes(self, style_name: str) -> Optional[bytes]:
+        """Get the serialized JSON response for a default style, or None for other styles"""
+        template = self._default_bytes.get(style_name)
+        if template is None:
+            return None
+        return template.replace(_TIMESTAMP_SENTINEL, f'"{self._get_timestamp()}"'.encode('ascii'))
+    
+    def _encode_default_style(self, style_name: str, config: Dict[str, Any]) -> bytes:
+        """Pre-serialize a default style response with a timestamp placeholder"""
+        response = {
+            **config,
+            'metadata': {
+                'timestamp': _TIMESTAMP_PLACEHOLDER,
+                'source': 'default',
+                'style_name': style_name
+            }
+        }
+        if orjson is not None:
+            return orjson.dumps(response)
+        return json.dumps(response, separators=(',', ':')).encode('utf-8')
+    
+    def _load_custom(self, style_name: str) -> Optional[Dict[str, Any]]:
+        """Load a custom style file, or None if it is missing, unreadable or not a JSON object"""
+        file_path = self._path(style_name)
+        try:
+            config = _load_json(file_path)
+        except (OSError, ValueError):
+            return None
+        return config if isinstance(config, dict) else None
     
     def update_style_config(self, style_name: str, config_data: Dict[str, Any]) -> Dict[str, Any]:
         """Update configuration for specific publication style"""
@@ -319,10 +332,10 @@ class StyleManager:
         }
         
         # Save to file
-        file_path = os.path.join(self.styles_directory, f'{style_name}.json')
+        self._config_cache.pop(style_name, None)
+        file_path = self._path(style_name)
         try:
-            with open(file_path, 'w') as f:
-                json.dump(config_data, f, indent=2)
+            _replace_json(file_path, config_data)
             
             return {
                 'success': True,
@@ -348,11 +361,12 @@ class StyleManager:
         }
         
         # Required fields
-        required_fields = ['name', 'font_family', 'font_size', 'line_spacing']
-        for field in required_fields:
-            if field not in style_data:
-                validation_results['errors'].append(f'Missing required field: {field}')
-                validation_results['valid'] = False
+        missing_fields = _REQUIRED_FIELDS.difference(style_data)
+        if missing_fields:
+            validation_results['errors'].extend(
+                f'Missing required field: {field}' for field in sorted(missing_fields)
+            )
+            validation_results['valid'] = False
         
         # Font size validation
         if 'font_size' in style_data:
@@ -362,37 +376,38 @@ class StyleManager:
         
         # Line spacing validation
         if 'line_spacing' in style_data:
-            try:
-                spacing = float(style_data['line_spacing'])
-                if spacing < 0.5 or spacing > 3.0:
-                    validation_results['warnings'].append('Line spacing outside recommended range (0.5-3.0)')
-            except ValueError:
+            spacing = _parse_line_spacing(style_data['line_spacing'])
+            if spacing is None:
                 validation_results['errors'].append('Line spacing must be a number')
                 validation_results['valid'] = False
+            elif spacing < 0.5 or spacing > 3.0:
+                validation_results['warnings'].append('Line spacing outside recommended range (0.5-3.0)')
         
         # Margin validation
         if 'page_margins' in style_data:
-            margins = style_data['page_margins']
-            required_margins = ['top', 'bottom', 'left', 'right']
-            for margin in required_margins:
-                if margin not in margins:
-                    validation_results['warnings'].append(f'Missing margin: {margin}')
+            missing_margins = _REQUIRED_MARGINS.difference(style_data['page_margins'])
+            validation_results['warnings'].extend(
+                f'Missing margin: {margin}' for margin in sorted(missing_margins)
+            )
         
         return validation_results
     
     def create_custom_style(self, style_name: str, base_style: str = 'ieee') -> Dict[str, Any]:
         """Create a new custom style based on existing style"""
-        base_config = self.get_style_config(base_style)
+        base_config = self._default_templates.get(base_style) or self._load_custom(base_style)
         if not base_config:
             return {
                 'success': False,
                 'message': f'Base style {base_style} not found'
             }
         
-        # Modify for custom style
-        custom_config = base_config.copy()
-        custom_config['name'] = style_name
-        custom_config['description'] = f'Custom style based on {base_style}'
+        # Modify for custom style; update_style_config writes fresh metadata
+        custom_config = {
+            **base_config,
+            'name': style_name,
+            'description': f'Custom style based on {base_style}'
+        }
+        custom_config.pop('metadata', None)
         
         return self.update_style_config(style_name, custom_config)
     
@@ -404,25 +419,30 @@ class StyleManager:
                 'message': 'Cannot delete default styles'
             }
         
-        file_path = os.path.join(self.styles_directory, f'{style_name}.json')
-        if os.path.exists(file_path):
-            try:
-                os.remove(file_path)
-                return {
-                    'success': True,
-                    'message': f'Style {style_name} deleted successfully'
-                }
-            except Exception as e:
-                return {
-                    'success': False,
-                    'message': f'Failed to delete style: {str(e)}'
-                }
-        else:
+        self._config_cache.pop(style_name, None)
+        file_path = self._path_for.pop(style_name, None) or self._path(style_name)
+        try:
+            os.remove(file_path)
+            return {
+                'success': True,
+                'message': f'Style {style_name} deleted successfully'
+            }
+        except FileNotFoundError:
             return {
                 'success': False,
                 'message': 'Style not found'
             }
+        except Exception as e:
+            return {
+                'success': False,
+                'message': f'Failed to delete style: {str(e)}'
+            }
     
     def _get_timestamp(self) -> str:
-        """Get current timestamp"""
-        return datetime.now().isoformat()
\ No newline at end of file
+        """Get current timestamp, formatted at most once per second"""
+        global _timestamp_cache
+        now = int(time.time())
+        cached = _timestamp_cache
+        if cached[0] != now:
+            cached = _timestamp_cache = (now, datetime.fromtimestamp(now).isoformat())
+        return cached[1]
\ No newline at end of file
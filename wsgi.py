@@ -0,0 +1,11 @@
+"""
+WSGI entry point for the Publication Style Config Server
+
+Run in production with:
+    gunicorn -w 4 -k gthread --threads 8 -b 0.0.0.0:5002 wsgi:app
+"""
+
+from app import app
+
+if __name__ == '__main__':
+    app.run(host='0.0.0.0', port=5002)